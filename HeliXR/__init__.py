@@ -1,13 +1,25 @@
+import os
 from flask import Flask, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_login import LoginManager
 from flask_socketio import SocketIO
+import threading
+from HeliXR.utils.auth import sqlite_engine_options, enable_sqlite_wal
 
 app = Flask(__name__)
 
 app.config['SECRET_KEY'] = 'c1877bdc3305c942f87b10f86e246167'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///site.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('HELIXR_DATABASE_URI', 'sqlite:///site.db')
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = sqlite_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+
+# Auth tuning: bcrypt cost for new hashes, how many logins may hash at once (and how
+# long a login waits for a turn), and how long a loaded user stays cached between requests.
+app.config['BCRYPT_LOG_ROUNDS'] = int(os.getenv('HELIXR_BCRYPT_ROUNDS', 12))
+app.config['BCRYPT_MAX_CONCURRENT'] = max(1, int(os.getenv('HELIXR_BCRYPT_MAX_CONCURRENT', 2)))
+app.config['LOGIN_QUEUE_TIMEOUT'] = float(os.getenv('HELIXR_LOGIN_QUEUE_TIMEOUT', 10))
+app.config['USER_CACHE_SIZE'] = int(os.getenv('HELIXR_USER_CACHE_SIZE', 1024))
+app.config['USER_CACHE_TTL'] = int(os.getenv('HELIXR_USER_CACHE_TTL', 300))
 
 app.mongo_db = None
 app.mongo_collection = None
@@ -21,6 +33,12 @@ bcrypt = Bcrypt(app)
 login_manager=LoginManager(app)
 socketio = SocketIO(app)
 
+# Limits concurrent password checks so a burst of logins can't starve the other routes.
+login_slots = threading.BoundedSemaphore(app.config['BCRYPT_MAX_CONCURRENT'])
+
+with app.app_context():
+    enable_sqlite_wal(db.engine)
+
 
 
 
@@ -1,6 +1,8 @@
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField , SubmitField ,BooleanField 
 from wtforms.validators import DataRequired , Length , Email , EqualTo ,ValidationError
+from sqlalchemy import or_
+from HeliXR import db
 from HeliXR.models import User
 
 class RegistrationForm(FlaskForm):
@@ -10,14 +12,20 @@ class RegistrationForm(FlaskForm):
     confirm_password = PasswordField('Confirm_Password' , validators=[DataRequired(),EqualTo('password')])
     submit = SubmitField("Sign Up")
 
+    def _existing_accounts(self):
+        """Fetches users clashing on username or email in one query, shared by both validators."""
+        if not hasattr(self, '_clashes'):
+            self._clashes = db.session.query(User.username, User.email).filter(
+                or_(User.username == self.username.data, User.email == self.email.data)
+            ).all()
+        return self._clashes
+
     def validate_username(self, username_field):
-        user = User.query.filter_by(username=username_field.data).first()
-        if user:
+        if any(row.username == username_field.data for row in self._existing_accounts()):
             raise ValidationError('That username is taken. Please choose a different one.')
 
     def validate_email(self, email_field):
-        user = User.query.filter_by(email=email_field.data).first()
-        if user:
+        if any(row.email == email_field.data for row in self._existing_accounts()):
             raise ValidationError('That email is already registered. Please choose a different one.')
 
 class LoginForm(FlaskForm):
@@ -1,10 +1,34 @@
-from HeliXR import db ,login_manager
+from HeliXR import app, db ,login_manager
 import email_validator
 from flask_login import UserMixin
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.util import identity_key
+from HeliXR.utils.auth import UserCache
+
+# Every authenticated request (sensor polls, chat calls) loads the user; keep it out of SQLite.
+user_cache = UserCache(max_size=app.config['USER_CACHE_SIZE'], ttl=app.config['USER_CACHE_TTL'])
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id)) 
+    user_id = int(user_id)
+    # If this request already holds the user, hand back that very object: merging
+    # the cached copy over it would clobber pending changes, detaching it loses them.
+    user = db.session.identity_map.get(identity_key(User, user_id))
+    if user is not None:
+        return user
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return db.session.merge(cached, load=False)
+    version = user_cache.version(user_id)
+    user = db.session.get(User, user_id)
+    if user is None:
+        return None
+    # The instance was loaded just now, so nobody else holds it: detach it for the
+    # cache and give the caller a separate, session-bound copy.
+    db.session.expunge(user)
+    user_cache.set(user_id, user, version=version)
+    return db.session.merge(user, load=False)
 
 class User(db.Model,UserMixin):
     id = db.Column(db.Integer,primary_key=True)
@@ -14,4 +38,20 @@ class User(db.Model,UserMixin):
     password = db.Column(db.String(60), nullable=False)
 
     def __repr__(self):
-        return f"User('{self.username}' ,'{self.email}', '{self.image_file}')"
\ No newline at end of file
+        return f"User('{self.username}' ,'{self.email}', '{self.image_file}')"
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def invalidate_cached_user(mapper, connection, target):
+    # Drop the entry at flush, and again once the change is committed: until then
+    # other connections still read the old row and could cache it for a full TTL.
+    user_cache.invalidate(target.id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('changed_user_ids', set()).add(target.id)
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def invalidate_committed_users(session):
+    for user_id in session.info.pop('changed_user_ids', ()):
+        user_cache.invalidate(user_id)
\ No newline at end of file
@@ -16,9 +16,10 @@ from pymongo import MongoClient
 from bson.json_util import dumps
 from datetime import datetime
 import uuid
-from HeliXR import app, db, bcrypt, socketio
+from HeliXR import app, db, bcrypt, socketio, login_slots
 from HeliXR.forms import RegistrationForm, LoginForm
 from HeliXR.models import User
+from HeliXR.utils.auth import bcrypt_rounds
 from pymongo import MongoClient
 from flask_login import login_user, current_user, logout_user
 
@@ -282,7 +283,21 @@ def login():
     if request.method == 'POST':
         if form.validate_on_submit():
             user = User.query.filter_by(email=form.email.data).first()
-            if user and bcrypt.check_password_hash(user.password, form.password.data):
+            if not login_slots.acquire(timeout=app.config['LOGIN_QUEUE_TIMEOUT']):
+                flash('The server is busy signing other users in. Please try again in a moment.', 'danger')
+                return render_template('login.html', title="HELIXR-Login", css_path="login", form=form), 503
+            new_hash = None
+            try:
+                valid = user is not None and bcrypt.check_password_hash(user.password, form.password.data)
+                # Re-hash once with the configured cost so changing BCRYPT_LOG_ROUNDS applies to old accounts too.
+                if valid and bcrypt_rounds(user.password) != app.config['BCRYPT_LOG_ROUNDS']:
+                    new_hash = bcrypt.generate_password_hash(form.password.data).decode('utf-8')
+            finally:
+                login_slots.release()
+            if new_hash:
+                user.password = new_hash
+                db.session.commit()
+            if valid:
                 login_user(user, remember=form.remember.data)
                 session['chat_history'] = []
                 return redirect(url_for('dashboard_analytics'))
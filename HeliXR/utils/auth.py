@@ -0,0 +1,102 @@
+# HeliXR/utils/auth.py
+# Helpers that keep authentication off the hot path: user caching, SQLite tuning, bcrypt cost.
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+
+class UserCache:
+    """Thread-safe LRU of detached User rows keyed by id, with a time-to-live.
+
+    Entries must be detached from any session; callers re-attach them per request
+    with `session.merge(user, load=False)`, which does not touch the database.
+
+    Each id has a version that `invalidate()` bumps. A loader reads `version()`
+    before querying and passes it to `set()`, so a row read before a concurrent
+    update commits is not cached after that update has invalidated it.
+    """
+
+    def __init__(self, max_size=1024, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return user
+
+    def version(self, user_id):
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def set(self, user_id, user, version=None):
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self._versions.get(user_id, 0):
+                return
+            self._entries[user_id] = (user, time.monotonic() + self.ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+def sqlite_engine_options(uri, pool_size=5, max_overflow=10, busy_timeout=15):
+    """Engine options giving a file-backed SQLite database a real connection pool.
+
+    Returns an empty dict for other databases and in-memory SQLite, where the
+    Flask-SQLAlchemy defaults are already right.
+    """
+    if not uri.startswith('sqlite') or ':memory:' in uri or uri.rstrip('/') == 'sqlite:':
+        return {}
+    return {
+        'poolclass': QueuePool,
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        # The sqlite3 driver waits this long for a lock instead of failing with "database is locked".
+        'connect_args': {'check_same_thread': False, 'timeout': busy_timeout},
+    }
+
+
+def enable_sqlite_wal(engine):
+    """Opens every new SQLite connection in WAL mode so readers don't block on writers."""
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        if not isinstance(dbapi_connection, sqlite3.Connection):
+            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+
+def bcrypt_rounds(pw_hash):
+    """Returns the cost factor a bcrypt hash was created with, e.g. 12 for '$2b$12$...'."""
+    try:
+        return int(pw_hash.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
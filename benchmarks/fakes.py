@@ -0,0 +1,220 @@
+# benchmarks/fakes.py
+# Offline stand-ins for MongoDB, the Gemini client and the Chatterbox TTS model.
+import copy
+import itertools
+import threading
+import time
+import uuid
+
+import torch
+from bson import ObjectId
+
+
+def seed_document():
+    """Returns a sensor document shaped like the ones the Unity/Arduino side writes."""
+    return {
+        "timestamp": None,
+        "sauce_sensor_data": {
+            "temperature_c": 24.6,
+            "humidity_pct": 52.0,
+            "pH": 7.1,
+            "color_rgb": [182, 34, 28]
+        },
+        "environment_data": {
+            "temperature_c": 22.3,
+            "humidity_pct": 48.0
+        },
+        "actuator_data": {
+            "mixer_speed_rpm": 120,
+            "servo_rotations_deg": {
+                "servo_1": 0,
+                "servo_2": 180,
+                "servo_3": 0,
+                "servo_4": 180,
+                "servo_5": 0
+            }
+        }
+    }
+
+
+# --- MONGODB ---
+
+class InsertOneResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+
+class InMemoryDatabase:
+    def __init__(self, name):
+        self.name = name
+        self._collections = {}
+
+    def __getitem__(self, name):
+        if name not in self._collections:
+            self._collections[name] = InMemoryCollection(name, self)
+        return self._collections[name]
+
+
+class InMemoryCollection:
+    """The subset of pymongo's Collection that routes.py uses.
+
+    Documents are copied on the way in and out, like a real round trip to the
+    server, so callers cannot mutate what is stored.
+    """
+
+    def __init__(self, name, database=None):
+        self.name = name
+        self.database = database or InMemoryDatabase("benchmark")
+        self._docs = []
+        self._lock = threading.Lock()
+
+    def insert_one(self, doc):
+        doc = copy.deepcopy(doc)
+        doc.setdefault("_id", ObjectId())
+        with self._lock:
+            self._docs.append(doc)
+        return InsertOneResult(doc["_id"])
+
+    def find_one(self, filter=None, sort=None):
+        with self._lock:
+            # Documents are kept in insertion order and ObjectIds increase with it, so
+            # the "latest by _id" lookup routes.py makes is a reverse scan, like an index.
+            if sort == [("_id", -1)]:
+                candidates = reversed(self._docs)
+            elif not sort or sort == [("_id", 1)]:
+                candidates = iter(self._docs)
+            else:
+                docs = list(self._docs)
+                for key, direction in reversed(sort):
+                    docs.sort(key=lambda d: d.get(key), reverse=direction < 0)
+                candidates = iter(docs)
+            for doc in candidates:
+                if all(doc.get(k) == v for k, v in (filter or {}).items()):
+                    return copy.deepcopy(doc)
+        return None
+
+    def delete_many(self, filter):
+        with self._lock:
+            self._docs = [d for d in self._docs
+                          if not all(d.get(k) == v for k, v in filter.items())]
+
+
+class FakeMongoClient:
+    def __init__(self, *args, **kwargs):
+        self._databases = {}
+
+    def __getitem__(self, name):
+        if name not in self._databases:
+            self._databases[name] = InMemoryDatabase(name)
+        return self._databases[name]
+
+
+# --- GEMINI ---
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class _State:
+    def __init__(self, name):
+        self.name = name
+
+
+class _File:
+    def __init__(self, name, state):
+        self.name = name
+        self.state = _State(state)
+
+
+class _Chat:
+    def __init__(self, client):
+        self._client = client
+
+    def send_message(self, message):
+        self._client.wait()
+        return _Response(self._client.next_reply())
+
+
+class _Chats:
+    def __init__(self, client):
+        self._client = client
+
+    def create(self, model):
+        return _Chat(self._client)
+
+
+class _Files:
+    def __init__(self, client):
+        self._client = client
+        self._uploaded = {}
+        self._lock = threading.Lock()
+
+    def upload(self, file):
+        self._client.wait()
+        name = f"files/{uuid.uuid4().hex}"
+        with self._lock:
+            self._uploaded[name] = file
+        return _File(name, "ACTIVE")
+
+    def get(self, name):
+        return _File(name, "ACTIVE")
+
+    def delete(self, name):
+        with self._lock:
+            self._uploaded.pop(name, None)
+
+
+class _Models:
+    def __init__(self, client):
+        self._client = client
+
+    def generate_content(self, model, contents):
+        self._client.wait()
+        return _Response(self._client.transcription)
+
+
+class FakeGenaiClient:
+    """Canned replacement for google.genai.Client.
+
+    Every call that would go over the network sleeps for `latency` seconds
+    first, so LLM round trips can be injected without an API key.
+    """
+
+    def __init__(self, api_key=None, latency=0.0, replies=None,
+                 transcription="Please open valve two."):
+        self.latency = latency
+        self.transcription = transcription
+        self._replies = itertools.cycle(replies or [
+            "All sensors are within their thresholds. Is there anything else I can assist you with today?"
+        ])
+        self._reply_lock = threading.Lock()
+        self.chats = _Chats(self)
+        self.files = _Files(self)
+        self.models = _Models(self)
+
+    def wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def next_reply(self):
+        with self._reply_lock:
+            return next(self._replies)
+
+
+# --- CHATTERBOX TTS ---
+
+class FakeTTS:
+    """Tiny stand-in for ChatterboxTTS: silence sized like real speech output."""
+
+    CHARS_PER_SECOND = 15
+
+    def __init__(self, sr=24000, latency=0.0):
+        self.sr = sr
+        self.latency = latency
+
+    def generate(self, text):
+        if self.latency:
+            time.sleep(self.latency)
+        samples = max(1, len(text)) * self.sr // self.CHARS_PER_SECOND
+        return torch.zeros(1, samples)
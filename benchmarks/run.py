@@ -0,0 +1,419 @@
+# benchmarks/run.py
+"""Offline benchmark suite for the HeliXR request paths.
+
+Boots the Flask app with in-memory MongoDB, a canned Gemini client and a tiny
+TTS stand-in, drives the dashboard/chat/voice/SocketIO workloads and reports
+throughput, p50/p99 latency and peak Python memory per workload. Memory is
+measured in a separate untimed pass so tracing does not slow the timed one.
+
+Run from the repository root:
+
+    python -m benchmarks.run                      # print a report
+    python -m benchmarks.run --save laptop        # also write benchmarks/baselines/laptop.json
+    python -m benchmarks.run --compare benchmarks/baselines/laptop.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest import mock
+
+from benchmarks.fakes import FakeGenaiClient, FakeMongoClient, FakeTTS, seed_document
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'baselines')
+
+BENCH_USERNAME = 'benchmark'
+# Must pass wtforms' Email() check, which rejects special-use domains such as .local.
+BENCH_EMAIL = 'benchmark@example.com'
+BENCH_PASSWORD = 'benchmark-password'
+
+COMMAND_PROMPTS = [
+    "Open valve 1",
+    "Please close valve two",
+    "Activate valve 3",
+    "Shut down valve five",
+    "Set mixer speed to 150",
+    "mixer to 90 rpm",
+]
+
+GENERAL_PROMPTS = [
+    "What is the current pH of the sauce?",
+    "Is the temperature within limits?",
+    "Summarise the status of all valves.",
+]
+
+# Metrics where a bigger number is worse; throughput is the only "higher is better" one.
+LOWER_IS_BETTER = ('p50_ms', 'p99_ms', 'peak_mem_kib')
+
+# Requests per client in the separate, untimed tracemalloc pass.
+MEMORY_PASS_ITERATIONS = 10
+
+
+# --- APP BOOTSTRAP ---
+
+def boot_app(args, workdir):
+    """Imports HeliXR with every external service replaced by a local fake."""
+    os.environ['HELIXR_DATABASE_URI'] = 'sqlite:///' + os.path.join(workdir, 'benchmark.db')
+
+    llm_latency = args.llm_delay / 1000.0
+
+    def make_genai_client(*client_args, **client_kwargs):
+        return FakeGenaiClient(latency=llm_latency)
+
+    if args.no_tts:
+        tts_patch = mock.patch('chatterbox.tts.ChatterboxTTS.from_pretrained',
+                               side_effect=RuntimeError("TTS disabled for benchmark"))
+    else:
+        tts_patch = mock.patch('chatterbox.tts.ChatterboxTTS.from_pretrained',
+                               return_value=FakeTTS(latency=args.tts_delay / 1000.0))
+
+    # routes.py creates temp_audio/ in the working directory on import; keep it in the workdir.
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with mock.patch('pymongo.MongoClient', FakeMongoClient), \
+                mock.patch('google.genai.Client', make_genai_client), \
+                tts_patch:
+            from HeliXR import app, db, bcrypt
+            from HeliXR import routes
+            from HeliXR.models import User
+    finally:
+        os.chdir(cwd)
+
+    app.config['WTF_CSRF_ENABLED'] = False
+    app.config['TEMP_FOLDER'] = os.path.join(workdir, 'temp_audio')
+    os.makedirs(app.config['TEMP_FOLDER'], exist_ok=True)
+    routes.AUDIO_FOLDER = os.path.join(workdir, 'audio_responses')
+    os.makedirs(routes.AUDIO_FOLDER, exist_ok=True)
+
+    reset_sensor_data(app)
+
+    with app.app_context():
+        hashed_password = bcrypt.generate_password_hash(BENCH_PASSWORD).decode('utf-8')
+        db.session.add(User(username=BENCH_USERNAME, email=BENCH_EMAIL, password=hashed_password))
+        db.session.commit()
+
+    return app
+
+
+def reset_sensor_data(app):
+    """Leaves only the seed document, so no workload depends on what ran before it."""
+    doc = seed_document()
+    doc['timestamp'] = datetime.utcnow()
+    app.mongo_collection.delete_many({})
+    app.mongo_collection.insert_one(doc)
+
+
+def post_login(client):
+    return client.post('/login', data={'email': BENCH_EMAIL, 'password': BENCH_PASSWORD})
+
+
+def logged_in_client(app):
+    client = app.test_client()
+    response = post_login(client)
+    if response.status_code != 302:
+        raise RuntimeError(f"Benchmark login failed with status {response.status_code}")
+    return client
+
+
+# --- MEASUREMENT ---
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def measure(workers, iterations, make_client, request_fn, background=None):
+    """Runs `request_fn(client, i)` `iterations` times on each of `workers` threads.
+
+    `request_fn` returns True on success. `background`, if given, runs on its own
+    thread for the duration of each pass and is not itself timed.
+
+    Latency and throughput come from a pass with allocation tracing off; peak
+    memory comes from a second, shorter pass under tracemalloc, whose overhead
+    would otherwise skew the timings.
+    """
+    clients = [make_client() for _ in range(workers)]
+    request_fn(clients[0], 0)  # warm-up: template compilation, first-hit imports
+
+    def run_pass(pass_iterations):
+        def worker(index):
+            client = clients[index]
+            latencies = []
+            errors = 0
+            for i in range(pass_iterations):
+                start = time.perf_counter()
+                ok = request_fn(client, index * pass_iterations + i)
+                latencies.append(time.perf_counter() - start)
+                if not ok:
+                    errors += 1
+            return latencies, errors
+
+        background_thread = None
+        if background:
+            background_thread = threading.Thread(target=background, daemon=True)
+            background_thread.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(worker, range(workers)))
+        wall = time.perf_counter() - start
+        if background_thread:
+            background_thread.join()
+        return results, wall
+
+    results, wall = run_pass(iterations)
+
+    tracemalloc.start()
+    run_pass(min(iterations, MEMORY_PASS_ITERATIONS))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = sorted(latency for worker_latencies, _ in results for latency in worker_latencies)
+    errors = sum(worker_errors for _, worker_errors in results)
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / wall, 2) if wall else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        'peak_mem_kib': round(peak / 1024, 1),
+    }
+
+
+# --- WORKLOADS ---
+
+def workload_sensor_poll(app, args, rng):
+    """N logged-in dashboards polling /api/sensor-data like dashboard_analytics.js."""
+    def request_fn(client, i):
+        return client.get('/api/sensor-data').status_code == 200
+    return measure(args.dashboards, args.requests, lambda: logged_in_client(app), request_fn)
+
+
+def workload_chat_commands(app, args, rng):
+    """Bursts of valve/mixer commands through /chat/gemini (Mongo write + TTS)."""
+    def request_fn(client, i):
+        prompt = COMMAND_PROMPTS[i % len(COMMAND_PROMPTS)]
+        response = client.post('/chat/gemini', json={'prompt': prompt})
+        return response.status_code == 200 and response.get_json().get('command_executed')
+    return measure(args.burst, args.requests, lambda: logged_in_client(app), request_fn)
+
+
+def workload_chat_general(app, args, rng):
+    """Free-form questions that fall through to the (fake) Gemini chat."""
+    def request_fn(client, i):
+        prompt = GENERAL_PROMPTS[i % len(GENERAL_PROMPTS)]
+        return client.post('/chat/gemini', json={'prompt': prompt}).status_code == 200
+    return measure(args.burst, args.requests, lambda: logged_in_client(app), request_fn)
+
+
+def workload_control_valve(app, args, rng):
+    """Bursts of direct valve commands through /api/control-valve."""
+    def request_fn(client, i):
+        payload = {'valve_number': i % 5 + 1, 'action': 'open' if i % 2 else 'close'}
+        return client.post('/api/control-valve', json=payload).status_code == 200
+    return measure(args.burst, args.requests, app.test_client, request_fn)
+
+
+def workload_voice_upload(app, args, rng):
+    """Voice recordings posted to /chat/voice_upload for transcription."""
+    audio = bytes(rng.getrandbits(8) for _ in range(args.audio_kib * 1024))
+
+    def request_fn(client, i):
+        response = client.post('/chat/voice_upload',
+                               data={'audio_file': (io.BytesIO(audio), 'recording.webm')},
+                               content_type='multipart/form-data')
+        return response.status_code == 200
+    return measure(args.burst, args.requests, lambda: logged_in_client(app), request_fn)
+
+
+def workload_socket_fanout(app, args, rng):
+    """One sensor_update broadcast fanned out to every connected SocketIO client."""
+    from HeliXR import socketio
+    from HeliXR.utils.arduino import sensor_data
+
+    subscribers = []
+
+    def make_subscribers():
+        subscribers.extend(socketio.test_client(app) for _ in range(args.subscribers))
+        return subscribers
+
+    def request_fn(clients, i):
+        payload = dict(sensor_data)
+        payload['temperature'] = round(23 + rng.random() * 2, 1)
+        payload['humidity'] = 45 + rng.randint(0, 5)
+        socketio.emit('sensor_update', payload)
+        return all(len(client.get_received()) == 1 for client in clients)
+
+    try:
+        return measure(1, args.requests, make_subscribers, request_fn)
+    finally:
+        for client in subscribers:
+            client.disconnect()
+
+
+def workload_login(app, args, rng):
+    """Fresh sessions logging in concurrently (password hash check per request)."""
+    def request_fn(client, i):
+        return post_login(app.test_client()).status_code == 302
+    return measure(args.burst, args.logins, app.test_client, request_fn)
+
+
+def workload_shift_change(app, args, rng):
+    """Dashboard polling latency while a burst of logins runs alongside it."""
+    def login_burst():
+        with ThreadPoolExecutor(max_workers=args.burst) as executor:
+            list(executor.map(lambda _: post_login(app.test_client()),
+                              range(args.burst * args.logins)))
+
+    def request_fn(client, i):
+        return client.get('/api/sensor-data').status_code == 200
+    return measure(args.dashboards, args.requests, lambda: logged_in_client(app), request_fn,
+                   background=login_burst)
+
+
+WORKLOADS = {
+    'sensor_poll': workload_sensor_poll,
+    'chat_commands': workload_chat_commands,
+    'chat_general': workload_chat_general,
+    'control_valve': workload_control_valve,
+    'voice_upload': workload_voice_upload,
+    'socket_fanout': workload_socket_fanout,
+    'login': workload_login,
+    'shift_change': workload_shift_change,
+}
+
+
+# --- REPORTING & BASELINES ---
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results):
+    header = f"{'workload':<15}{'reqs':>7}{'err':>5}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>11}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        print(f"{name:<15}{r['requests']:>7}{r['errors']:>5}{r['throughput_rps']:>10.1f}"
+              f"{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['peak_mem_kib']:>11.1f}")
+
+
+def save_baseline(name, report):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = os.path.join(BASELINE_DIR, f"{name}.json")
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def compare_to_baseline(path, report, threshold):
+    """Prints per-metric deltas against a saved baseline; returns the regressions found."""
+    with open(path) as f:
+        baseline = json.load(f)
+
+    if baseline['meta']['params'] != report['meta']['params']:
+        print("warning: baseline was recorded with different parameters; deltas may not be comparable")
+
+    print(f"\nCompared with {path} (commit {baseline['meta'].get('commit')}), threshold {threshold:.0f}%")
+    regressions = []
+    for name, current in report['results'].items():
+        previous = baseline['results'].get(name)
+        if not previous:
+            continue
+        for metric in ('throughput_rps',) + LOWER_IS_BETTER:
+            old, new = previous[metric], current[metric]
+            if not old:
+                continue
+            change = (new - old) / old * 100
+            worse = change > threshold if metric in LOWER_IS_BETTER else change < -threshold
+            flag = '  REGRESSION' if worse else ''
+            print(f"  {name:<15}{metric:<16}{old:>12.2f} -> {new:>12.2f} ({change:+.1f}%){flag}")
+            if worse:
+                regressions.append((name, metric, change))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the HeliXR request paths.")
+    parser.add_argument('--only', nargs='+', choices=sorted(WORKLOADS), help="workloads to run (default: all)")
+    parser.add_argument('--dashboards', type=int, default=8, help="concurrent dashboards polling sensor data")
+    parser.add_argument('--burst', type=int, default=4, help="concurrent clients sending commands/uploads/logins")
+    parser.add_argument('--requests', type=int, default=50, help="requests per client per workload")
+    parser.add_argument('--logins', type=int, default=5, help="logins per client in the login workloads")
+    parser.add_argument('--subscribers', type=int, default=50, help="SocketIO clients receiving each broadcast")
+    parser.add_argument('--audio-kib', type=int, default=64, help="size of each uploaded voice recording")
+    parser.add_argument('--llm-delay', type=float, default=0.0, help="injected Gemini latency per call, in ms")
+    parser.add_argument('--tts-delay', type=float, default=0.0, help="injected TTS latency per utterance, in ms")
+    parser.add_argument('--no-tts', action='store_true', help="run in text-only mode, as when TTS fails to load")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', metavar='NAME', help="save results to benchmarks/baselines/NAME.json")
+    parser.add_argument('--compare', metavar='PATH', help="compare results with a saved baseline")
+    parser.add_argument('--threshold', type=float, default=15.0,
+                        help="percent change counted as a regression (default: 15)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp(prefix='helixr-bench-')
+    results = {}
+    try:
+        # routes.py prints progress for model loading and uploads; keep the report readable.
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = boot_app(args, workdir)
+            for name in args.only or WORKLOADS:
+                print(f"running {name}...", file=sys.stderr)
+                reset_sensor_data(app)
+                results[name] = WORKLOADS[name](app, args, rng)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    params = {key: value for key, value in vars(args).items()
+              if key not in ('save', 'compare', 'threshold', 'only')}
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'created': datetime.utcnow().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': params,
+        },
+        'results': results,
+    }
+
+    print_report(results)
+    if args.save:
+        print(f"\nBaseline saved to {save_baseline(args.save, report)}")
+    if args.compare:
+        if compare_to_baseline(args.compare, report, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import pytest
+from sqlalchemy import event
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Read by HeliXR/__init__.py at import time: in-memory SQLite and the cheapest bcrypt cost.
+os.environ['HELIXR_DATABASE_URI'] = 'sqlite://'
+os.environ['HELIXR_BCRYPT_ROUNDS'] = '4'
+
+from benchmarks.fakes import FakeGenaiClient, FakeMongoClient
+
+
+def _import_app():
+    """Imports HeliXR offline, before any test module does.
+
+    routes.py talks to Gemini, MongoDB and the TTS model at import time, and
+    creates temp_audio/ in the working directory.
+    """
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix='helixr-tests-'))
+    try:
+        with mock.patch('pymongo.MongoClient', FakeMongoClient), \
+                mock.patch('google.genai.Client', FakeGenaiClient), \
+                mock.patch('chatterbox.tts.ChatterboxTTS.from_pretrained',
+                           side_effect=RuntimeError("TTS disabled in tests")):
+            import HeliXR
+    finally:
+        os.chdir(cwd)
+    return HeliXR.app
+
+
+helixr_app = _import_app()
+
+
+@pytest.fixture
+def app():
+    helixr_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    return helixr_app
+
+
+@pytest.fixture
+def db(app):
+    from HeliXR import db
+    from HeliXR.models import user_cache
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    user_cache.clear()
+    return db
+
+
+@pytest.fixture
+def make_user(app, db):
+    from HeliXR import bcrypt
+    from HeliXR.models import User
+
+    def make_user(username='operator', email='operator@example.com', password='secret', rounds=None):
+        with app.app_context():
+            pw_hash = bcrypt.generate_password_hash(password, rounds).decode('utf-8')
+            user = User(username=username, email=email, password=pw_hash)
+            db.session.add(user)
+            db.session.commit()
+            return user.id
+    return make_user
+
+
+@pytest.fixture
+def queries(app, db):
+    """SQL statements executed while the test runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', record)
@@ -0,0 +1,213 @@
+# tests/test_auth.py
+import time
+
+import pytest
+
+from HeliXR import bcrypt, login_slots
+from HeliXR.forms import RegistrationForm
+from HeliXR.models import User, load_user, user_cache
+from HeliXR.utils.auth import UserCache, bcrypt_rounds
+
+
+# --- UserCache ---
+
+def test_user_cache_hit_and_invalidate():
+    cache = UserCache(max_size=4, ttl=60)
+    cache.set(1, 'alice')
+    assert cache.get(1) == 'alice'
+    cache.invalidate(1)
+    assert cache.get(1) is None
+
+
+def test_user_cache_evicts_least_recently_used():
+    cache = UserCache(max_size=2, ttl=60)
+    cache.set(1, 'alice')
+    cache.set(2, 'bob')
+    cache.get(1)
+    cache.set(3, 'carol')
+    assert cache.get(1) == 'alice'
+    assert cache.get(2) is None
+    assert cache.get(3) == 'carol'
+
+
+def test_user_cache_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    cache = UserCache(max_size=4, ttl=60)
+    cache.set(1, 'alice')
+    now[0] += 59
+    assert cache.get(1) == 'alice'
+    now[0] += 1
+    assert cache.get(1) is None
+
+
+def test_user_cache_ignores_rows_read_before_an_invalidation():
+    cache = UserCache(max_size=4, ttl=60)
+    version = cache.version(1)
+    cache.invalidate(1)
+    cache.set(1, 'stale', version=version)
+    assert cache.get(1) is None
+    cache.set(1, 'fresh', version=cache.version(1))
+    assert cache.get(1) == 'fresh'
+
+
+def test_user_cache_disabled_with_zero_ttl():
+    cache = UserCache(max_size=4, ttl=0)
+    cache.set(1, 'alice')
+    assert cache.get(1) is None
+
+
+@pytest.mark.parametrize('pw_hash, rounds', [
+    ('$2b$12$KIXQJ0Yx8WqVZs3Yl6yP5eJ3cQ4P7V1sY0a8jJwz3mN6u2fHn9E1K', 12),
+    ('$2a$04$abcdefghijklmnopqrstuu', 4),
+    ('not-a-bcrypt-hash', None),
+    ('', None),
+    (None, None),
+])
+def test_bcrypt_rounds(pw_hash, rounds):
+    assert bcrypt_rounds(pw_hash) == rounds
+
+
+# --- load_user ---
+
+def test_load_user_serves_repeat_requests_from_cache(app, db, make_user, queries):
+    user_id = make_user()
+    with app.app_context():
+        assert load_user(str(user_id)).username == 'operator'
+    queries.clear()
+
+    with app.app_context():
+        user = load_user(str(user_id))
+        assert user.username == 'operator'
+        assert user in db.session
+    assert queries == []
+
+
+def test_load_user_returns_instance_already_in_session(app, db, make_user):
+    user_id = make_user()
+    with app.app_context():
+        load_user(str(user_id))  # populate the cache
+
+    with app.app_context():
+        held = db.session.get(User, user_id)
+        held.username = 'renamed'
+        assert load_user(str(user_id)) is held
+        assert held in db.session
+        db.session.commit()
+
+    with app.app_context():
+        assert load_user(str(user_id)).username == 'renamed'
+
+
+def test_load_user_unknown_id(app, db):
+    with app.app_context():
+        assert load_user('42') is None
+
+
+def test_profile_update_invalidates_cached_user(app, db, make_user):
+    user_id = make_user()
+    with app.app_context():
+        load_user(str(user_id))
+    assert user_cache.get(user_id) is not None
+
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        user.username = 'shift-lead'
+        db.session.commit()
+    assert user_cache.get(user_id) is None
+
+    with app.app_context():
+        assert load_user(str(user_id)).username == 'shift-lead'
+
+
+def test_delete_invalidates_cached_user(app, db, make_user):
+    user_id = make_user()
+    with app.app_context():
+        load_user(str(user_id))
+
+    with app.app_context():
+        db.session.delete(db.session.get(User, user_id))
+        db.session.commit()
+    assert user_cache.get(user_id) is None
+
+    with app.app_context():
+        assert load_user(str(user_id)) is None
+
+
+# --- login ---
+
+def login(app, email='operator@example.com', password='secret'):
+    return app.test_client().post('/login', data={'email': email, 'password': password})
+
+
+def test_login_rehashes_password_with_configured_cost(app, db, make_user):
+    user_id = make_user(rounds=5)
+    assert login(app).status_code == 302
+
+    with app.app_context():
+        pw_hash = db.session.get(User, user_id).password
+        assert bcrypt_rounds(pw_hash) == app.config['BCRYPT_LOG_ROUNDS'] == 4
+        assert bcrypt.check_password_hash(pw_hash, 'secret')
+
+
+def test_login_keeps_hash_at_configured_cost(app, db, make_user):
+    user_id = make_user(rounds=4)
+    with app.app_context():
+        before = db.session.get(User, user_id).password
+    assert login(app).status_code == 302
+    with app.app_context():
+        assert db.session.get(User, user_id).password == before
+
+
+def test_login_with_wrong_password(app, db, make_user):
+    make_user()
+    assert login(app, password='wrong').status_code == 200
+
+
+def test_login_fails_fast_when_no_slot_is_free(app, db, make_user, monkeypatch):
+    make_user()
+    monkeypatch.setitem(app.config, 'LOGIN_QUEUE_TIMEOUT', 0.01)
+    held = 0
+    while login_slots.acquire(blocking=False):
+        held += 1
+    try:
+        assert login(app).status_code == 503
+    finally:
+        for _ in range(held):
+            login_slots.release()
+    assert login(app).status_code == 302
+
+
+# --- registration ---
+
+def registration_form(app, username, email):
+    data = {'username': username, 'email': email, 'password': 'secret', 'confirm_password': 'secret'}
+    with app.test_request_context('/register', method='POST', data=data):
+        form = RegistrationForm()
+        form.validate()
+    return form
+
+
+def test_registration_checks_uniqueness_in_one_query(app, db, make_user, queries):
+    make_user()
+    queries.clear()
+    form = registration_form(app, 'operator', 'operator@example.com')
+    assert 'username' in form.errors
+    assert 'email' in form.errors
+    assert len([q for q in queries if q.lstrip().upper().startswith('SELECT')]) == 1
+
+
+def test_registration_reports_each_clash_separately(app, db, make_user):
+    make_user()
+    form = registration_form(app, 'operator', 'someone-else@example.com')
+    assert 'username' in form.errors
+    assert 'email' not in form.errors
+
+    form = registration_form(app, 'someone-else', 'operator@example.com')
+    assert 'username' not in form.errors
+    assert 'email' in form.errors
+
+
+def test_registration_accepts_new_account(app, db, make_user):
+    make_user()
+    assert registration_form(app, 'newcomer', 'newcomer@example.com').errors == {}